@@ -31,18 +31,45 @@ loadSettingsFile(find('settings.js'));
 loadSettingsFile(find('settings_internal.js'));
 
 const argv = process.argv.slice(2);
-const symbolsOnlyArg = argv.indexOf('--symbols-only');
-if (symbolsOnlyArg != -1) {
-  argv.splice(symbolsOnlyArg, 1);
+
+// Remove the given flag from argv, returning true if it was present.
+function consumeFlag(flag) {
+  const index = argv.indexOf(flag);
+  if (index == -1) {
+    return false;
+  }
+  argv.splice(index, 1);
+  return true;
+}
+
+// Remove the given `--flag=value` from argv, returning its value (or null if
+// it was not present).
+function consumeFlagValue(flag) {
+  const index = argv.findIndex((arg) => arg.startsWith(flag + '='));
+  if (index == -1) {
+    return null;
+  }
+  const value = argv[index].slice(flag.length + 1);
+  argv.splice(index, 1);
+  return value;
 }
 
+const symbolsOnlyFlag = consumeFlag('--symbols-only');
+// Like --symbols-only, but only output the symbol names, one per line (used by
+// gen_sig_info.py).
+const symbolNamesOnly = consumeFlag('--symbol-names-only');
+// Regular expression of symbol names to omit from the --symbol-names-only
+// output.
+const excludeSymbolsArg = consumeFlagValue('--exclude-symbols');
+const excludeSymbols = excludeSymbolsArg ? new RegExp(excludeSymbolsArg) : null;
+
 // Load settings from JSON passed on the command line
 const settingsFile = argv[0];
 assert(settingsFile);
 const user_settings = JSON.parse(read(settingsFile));
 applySettings(user_settings);
 
-export const symbolsOnly = symbolsOnlyArg != -1;
+export const symbolsOnly = symbolsOnlyFlag || symbolNamesOnly;
 
 // In case compiler.mjs is run directly (as in gen_sig_info)
 // ALL_INCOMING_MODULE_JS_API might not be populated yet.
@@ -86,7 +113,7 @@ const jsifier = await import('./jsifier.mjs');
 const B = new Benchmarker();
 
 try {
-  jsifier.runJSify(symbolsOnly);
+  jsifier.runJSify(symbolsOnly, symbolNamesOnly, excludeSymbols);
 
   B.print('glue');
 } catch (err) {
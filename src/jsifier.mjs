@@ -160,7 +160,7 @@ function preJS() {
   return result;
 }
 
-export function runJSify(symbolsOnly) {
+export function runJSify(symbolsOnly, symbolNamesOnly = false, excludeSymbols = null) {
   const libraryItems = [];
   const symbolDeps = {};
   const asyncFuncs = [];
@@ -447,7 +447,13 @@ function(${args}) {
       }
 
       if (symbolsOnly) {
-        if (LibraryManager.library.hasOwnProperty(symbol)) {
+        if (symbolNamesOnly) {
+          // Only the names are needed, so skip the (expensive) calculation of
+          // transitive deps.
+          if (LibraryManager.library.hasOwnProperty(symbol)) {
+            symbolDeps[symbol] = [];
+          }
+        } else if (LibraryManager.library.hasOwnProperty(symbol)) {
           // Resolve aliases before looking up deps
           var resolvedSymbol = resolveAlias(symbol);
           var transtiveDeps = getTransitiveDeps(resolvedSymbol);
@@ -776,7 +782,13 @@ var proxiedFunctionTable = [
     symbolHandler(sym);
   }
 
-  if (symbolsOnly) {
+  if (symbolNamesOnly) {
+    let names = Object.keys(symbolDeps);
+    if (excludeSymbols) {
+      names = names.filter((name) => !excludeSymbols.test(name));
+    }
+    print(names.join('\n'));
+  } else if (symbolsOnly) {
     print(
       JSON.stringify({
         deps: symbolDeps,
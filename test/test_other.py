@@ -12878,9 +12878,20 @@ exec "$@"
     # This tests is fragile and will need updating any time a JS library
     # function is added or its signature changed.  However it's easy to
     # rebaseline with --rebaseline.
-    self.run_process([PYTHON, path_from_root('tools/maint/gen_sig_info.py'), '-o', 'out.js'])
+    self.run_process([PYTHON, path_from_root('tools/maint/gen_sig_info.py'), '--no-cache', '-o', 'out.js'])
     self.assertFileContents(path_from_root('src/library_sigs.js'), read_file('out.js'))
 
+  def test_compiler_symbol_names_only(self):
+    # `--symbol-names-only` with `--exclude-symbols` (as used by gen_sig_info.py)
+    # should list the same symbols as `--symbols-only`, minus the excluded ones.
+    exclude = importlib.import_module('tools.maint.gen_sig_info').ignored_symbol_re
+    create_file('settings.json', json.dumps({'USE_SDL': 1, 'MAX_WEBGL_VERSION': 2}))
+    compiler = config.NODE_JS + [path_from_root('src/compiler.mjs')]
+    output = self.run_process(compiler + ['--symbols-only', 'settings.json'], stdout=PIPE).stdout
+    expected = [s for s in json.loads(output)['deps'] if not re.match(exclude, s)]
+    output = self.run_process(compiler + ['--symbol-names-only', '--exclude-symbols=' + exclude, 'settings.json'], stdout=PIPE).stdout
+    self.assertEqual(expected, output.splitlines())
+
   def test_gen_struct_info_env(self):
     # gen_struct_info.py builds C code in a very specific and low level way.  We don't want
     # EMCC_CFLAGS (or any of the other environment variables that might effect compilation or
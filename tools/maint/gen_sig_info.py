@@ -11,19 +11,23 @@ for the majority of JS library functions.
 """
 
 import argparse
+import concurrent.futures
+import functools
+import hashlib
 import json
 import os
 import sys
 import subprocess
 import re
-import glob
+import shlex
+import tempfile
 
 
 __scriptdir__ = os.path.dirname(os.path.abspath(__file__))
 __rootdir__ = os.path.dirname(os.path.dirname(__scriptdir__))
 sys.path.insert(0, __rootdir__)
 
-from tools import shared, utils, webassembly
+from tools import cache, config, shared, utils, webassembly
 
 c_header = '''/* Auto-generated by %s */
 
@@ -165,49 +169,61 @@ wasi_symbols = {
 }
 
 
+ignored_symbols = {
+  'SDL_GetKeyState',
+  '__stack_base', '__memory_base', '__table_base', '__global_base', '__heap_base',
+  '__stack_pointer', '__stack_high', '__stack_low', '_load_secondary_module',
+  '__asyncify_state', '__asyncify_data',
+  # legacy aliases, not callable from native code.
+  'stackSave', 'stackRestore', 'stackAlloc', 'getTempRet0', 'setTempRet0',
+}
+
+# JS-only symbols, GL/AL internals, GL extension functions, and the
+# `__cxa_find_matching_catch_N` family.  This is passed to compiler.mjs (via
+# `--exclude-symbols`) so that these symbols are filtered out at the source,
+# which means it is evaluated as a JS regular expression.
+ignored_symbol_re = r'^(?:\$|emscripten_gl|emscripten_alc|__cxa_find_matching_catch|gl.*(?:NV|EXT|WEBGL|ARB|ANGLE)$)'
+
+
 def ignore_symbol(s, cxx):
-  if s.startswith('$'):
-    return True
-  if s in {'SDL_GetKeyState'}:
+  # Note: symbols matching `ignored_symbol_re` are already excluded by
+  # compiler.mjs.
+  if s in ignored_symbols:
     return True
-  if s.startswith('emscripten_gl') or s.startswith('emscripten_alc'):
-    return True
-  if s.startswith('gl') and any(s.endswith(x) for x in ('NV', 'EXT', 'WEBGL', 'ARB', 'ANGLE')):
-    return True
-  if s in {'__stack_base', '__memory_base', '__table_base', '__global_base', '__heap_base',
-           '__stack_pointer', '__stack_high', '__stack_low', '_load_secondary_module',
-           '__asyncify_state', '__asyncify_data',
-           # legacy aliases, not callable from native code.
-           'stackSave', 'stackRestore', 'stackAlloc', 'getTempRet0', 'setTempRet0',
-           }:
-    return True
-  if cxx and s in ('__asctime_r') or s.startswith('__cxa_find_matching_catch'):
+  if cxx and s == '__asctime_r':
     return True
   return False
 
 
 def create_c_file(filename, symbol_list, header):
-  source_lines = [header]
-  source_lines.append('\nvoid* symbol_list[] = {')
-  for s in symbol_list:
+  # The symbols are listed once in an X-macro and then expanded by the
+  # preprocessor into the `symbol_list` initializer, which keeps the generated
+  # file (and the amount of text the compiler has to tokenize) small.
+  def symbol_entry(s):
     if s in wasi_symbols:
-      source_lines.append(f'  (void*)&__wasi_{s},')
+      return f'  X(__wasi_{s}) \\\n'
     else:
-      source_lines.append(f'  (void*)&{s},')
-  source_lines.append(footer)
-  utils.write_file(filename, '\n'.join(source_lines) + '\n')
-
-
-def valuetype_to_chr(t, t64):
-  if t == webassembly.Type.I32 and t64 == webassembly.Type.I64:
-    return 'p'
-  assert t == t64
-  return {
-    webassembly.Type.I32: 'i',
-    webassembly.Type.I64: 'j',
-    webassembly.Type.F32: 'f',
-    webassembly.Type.F64: 'd',
-  }[t]
+      return f'  X({s}) \\\n'
+
+  with open(filename, 'w', encoding='utf-8') as f:
+    f.write(header)
+    f.write('\n#define SYMBOLS(X) \\\n')
+    f.writelines(symbol_entry(s) for s in symbol_list)
+    f.write('\n#define SYMBOL_REF(s) (void*)&s,\n')
+    f.write('\nvoid* symbol_list[] = {\n')
+    f.write('  SYMBOLS(SYMBOL_REF)\n')
+    f.write(footer + '\n')
+
+
+# Map of (wasm32 type, wasm64 type) to `__sig` character.  Values that are i32
+# under wasm32 but i64 under wasm64 are pointers (or `size_t`).
+sig_chars = {
+  (webassembly.Type.I32, webassembly.Type.I32): 'i',
+  (webassembly.Type.I64, webassembly.Type.I64): 'j',
+  (webassembly.Type.F32, webassembly.Type.F32): 'f',
+  (webassembly.Type.F64, webassembly.Type.F64): 'd',
+  (webassembly.Type.I32, webassembly.Type.I64): 'p',
+}
 
 
 def functype_to_str(t, t64):
@@ -215,12 +231,10 @@ def functype_to_str(t, t64):
   assert len(t.params) == len(t64.params)
   if t.returns:
     assert len(t.returns) == 1
-    rtn = valuetype_to_chr(t.returns[0], t64.returns[0])
+    rtn = sig_chars[(t.returns[0], t64.returns[0])]
   else:
     rtn = 'v'
-  for p, p64 in zip(t.params, t64.params):
-    rtn += valuetype_to_chr(p, p64)
-  return rtn
+  return rtn + ''.join(sig_chars[p] for p in zip(t.params, t64.params))
 
 
 def write_sig_library(filename, sig_info):
@@ -241,56 +255,237 @@ def write_sig_library(filename, sig_info):
   utils.write_file(filename, '\n'.join(lines) + '\n')
 
 
+@shared.memoize
+def get_src_js_files():
+  """Return all the JS files in the `src` directory, including those in
+  subdirectories."""
+  js_files = []
+  for root, _, files in os.walk('src'):
+    js_files += [os.path.join(root, f) for f in files if f.endswith('.js')]
+  return sorted(js_files)
+
+
+def rewrite_js_files(transform, exclude=()):
+  """Apply `transform` to the contents of each of the JS files in `src`.
+
+  The contents are passed as `bytes` since all the patterns we are looking for
+  are ASCII and this avoids decoding and re-encoding every file.
+
+  Files are only written back if their contents actually changed, to avoid
+  needlessly touching their modification times.  Returns the number of files
+  that were modified.
+  """
+  def rewrite_file(file):
+    orig = utils.read_binary(file)
+    new = transform(orig)
+    if new == orig:
+      return False
+    utils.write_binary(file, new)
+    return True
+
+  files = [f for f in get_src_js_files() if os.path.basename(f) not in exclude]
+  with concurrent.futures.ThreadPoolExecutor(max_workers=shared.get_num_cores()) as executor:
+    return sum(executor.map(rewrite_file, files))
+
+
 def update_sigs(sig_info):
   print("updating __sig attributes ...")
 
-  def update_line(l):
-    if '__sig' not in l:
-      return l
-    stripped = l.strip()
-    for sym, sig in sig_info.items():
-      if stripped.startswith(f'{sym}__sig:'):
-        return re.sub(rf"\b{sym}__sig: '.*'", f"{sym}__sig: '{sig}'", l)
-    return l
+  # Match every `foo__sig: '...'` at the start of a line in one pass, and
+  # then look up the symbol in `sig_info` in the replacement callback.
+  sig_re = re.compile(rb"^([ \t]*)(\w+)__sig: '[^']*'", re.MULTILINE)
+  sigs = {sym.encode(): sig.encode() for sym, sig in sig_info.items()}
 
-  files = glob.glob('src/*.js') + glob.glob('src/**/*.js')
-  for file in files:
-    lines = utils.read_file(file).splitlines()
-    lines = [update_line(l) for l in lines]
-    utils.write_file(file, '\n'.join(lines) + '\n')
+  def replace_sig(m):
+    sym = m.group(2)
+    if sym not in sigs:
+      return m.group(0)
+    return m.group(1) + sym + b"__sig: '" + sigs[sym] + b"'"
+
+  modified = rewrite_js_files(lambda contents: sig_re.sub(replace_sig, contents))
+  print(f'updated {modified} file(s)')
 
 
 def remove_sigs(sig_info):
   print("removing __sig attributes ...")
 
-  to_remove = [f'{sym}__sig:' for sym in sig_info.keys()]
+  sig_re = re.compile(rb'\s*(\w+)__sig:')
+  syms = {sym.encode() for sym in sig_info}
 
   def strip_line(l):
-    l = l.strip()
-    return any(l.startswith(r) for r in to_remove)
+    m = sig_re.match(l)
+    return bool(m and m.group(1) in syms)
+
+  def strip_file(contents):
+    lines = [l for l in contents.splitlines() if not strip_line(l)]
+    return b'\n'.join(lines) + b'\n'
 
-  files = glob.glob('src/*.js') + glob.glob('src/**/*.js')
-  for file in files:
-    if os.path.basename(file) != 'library_sigs.js':
-      lines = utils.read_file(file).splitlines()
-      lines = [l for l in lines if not strip_line(l)]
-      utils.write_file(file, '\n'.join(lines) + '\n')
+  modified = rewrite_js_files(strip_file, exclude=('library_sigs.js',))
+  print(f'removed __sig entries from {modified} file(s)')
 
 
 def extract_sigs(symbols, obj_file):
   sig_info = {}
+  wanted = set(symbols)
   with webassembly.Module(obj_file) as mod:
-    imports = mod.get_imports()
     types = mod.get_types()
-    import_map = {i.field: i for i in imports}
-    for s in symbols:
-      sig_info[s] = types[import_map[s].type]
+    for i in mod.get_imports():
+      if i.field in wanted:
+        sig_info[i.field] = types[i.type]
+        wanted.remove(i.field)
+        if not wanted:
+          break
+  assert not wanted, f'symbols not found in {obj_file}: {sorted(wanted)}'
   return sig_info
 
 
-def extract_sig_info(sig_info, extra_settings=None, extra_cflags=None, cxx=False):
-  print(' .. ' + str(extra_settings) + ' + ' + str(extra_cflags))
-  tempfiles = shared.get_temp_files()
+@shared.memoize
+def get_input_timestamps():
+  """Return the modification times of all the files that can affect the
+  output of `extract_sig_info`: the JS compiler and library files, the system
+  headers (including extensionless C++ headers such as `<string>`), the python
+  code that determines the compiler flags (including this script itself), and
+  the clang binaries."""
+  timestamps = []
+  for path in (__file__, utils.path_from_root('emcc.py'), shared.CLANG_CC, shared.CLANG_CXX):
+    if os.path.exists(path):
+      timestamps.append((path, os.path.getmtime(path)))
+  tools_dir = utils.path_from_root('tools')
+  for f in os.listdir(tools_dir):
+    if f.endswith('.py'):
+      path = os.path.join(tools_dir, f)
+      timestamps.append((os.path.relpath(path, utils.path_from_root()), os.path.getmtime(path)))
+  for d, exts in (('src', ('.js', '.mjs')),
+                  ('system/include', ('.h', '.hpp')),
+                  ('system/lib', ('.h', '.hpp'))):
+    for root, _, files in os.walk(utils.path_from_root(d)):
+      for f in files:
+        if f.endswith(exts) or (d != 'src' and '.' not in f):
+          path = os.path.join(root, f)
+          timestamps.append((os.path.relpath(path, utils.path_from_root()), os.path.getmtime(path)))
+  return sorted(timestamps)
+
+
+def sig_cache_key(settings, extra_cflags, cxx):
+  key = json.dumps({
+    'settings': settings,
+    'cflags': extra_cflags,
+    'cxx': cxx,
+    'version': shared.generate_sanity(),
+    'inputs': get_input_timestamps(),
+  }, sort_keys=True)
+  return hashlib.sha1(key.encode('utf-8')).hexdigest()
+
+
+def read_cached_sig_info(cache_name):
+  """Return the cached signatures stored under `cache_name`, or None."""
+  cache_file = cache.get_path(cache_name)
+  if not cache_file.exists():
+    return None
+  return json.loads(utils.read_file(cache_file))
+
+
+def write_cached_sig_info(cache_name, sig_info):
+  def create_cache_file(filename):
+    # Write to a temporary file first so that an interrupted run can never
+    # leave a truncated cache entry behind.
+    temp_filename = f'{filename}.{os.getpid()}.tmp'
+    utils.write_file(temp_filename, json.dumps(sig_info, sort_keys=True))
+    os.replace(temp_filename, filename)
+
+  cache.get(cache_name, create_cache_file, what='signature info', quiet=True)
+
+
+def merge_sig_info(sig_info, new_sig_info):
+  for sym, sig_string in new_sig_info.items():
+    if sym in sig_info:
+      if sig_info[sym] != sig_string:
+        print(sym)
+        print(sig_string)
+        print(sig_info[sym])
+        assert sig_info[sym] == sig_string
+    sig_info[sym] = sig_string
+
+
+def get_clang_flags(cxx, memory64):
+  """Return the flags that emcc would pass to clang when compiling with
+  `-pthread --tracing` (and `-sMEMORY64` if requested).
+
+  We only need object files to extract import signatures from, so we ask emcc
+  for these flags once per flag set, and then invoke clang directly rather
+  than paying the cost of the emcc wrapper for each build."""
+  cmd = [shared.EMXX if cxx else shared.EMCC, '--cflags', '-pthread', '--tracing']
+  if memory64:
+    cmd += ['-sMEMORY64', '-Wno-experimental']
+  output = shared.check_call(cmd, stdout=subprocess.PIPE).stdout
+  # `shlex_join` (used by emcc to print the flags) does not escape backslashes,
+  # so escape them here to preserve Windows paths (emcc does the same when
+  # parsing the clang command line for `--cflags`).
+  return shlex.split(output.replace('\\', '\\\\'))
+
+
+def compile_sig_info(tmpdir, symbols, extra_cflags, cxx, clang_flags32, clang_flags64):
+  """Compile the given symbols (with the given flags) and return a map of each
+  symbol to its `__sig` string.  `clang_flags32` and `clang_flags64` are the
+  wasm32 and wasm64 flags from `get_clang_flags`."""
+  scratch = get_scratch_name(tmpdir)
+  if cxx:
+    ext = '.cpp'
+    compiler = shared.CLANG_CXX
+    header = cxx_header
+  else:
+    ext = '.c'
+    compiler = shared.CLANG_CC
+    header = c_header
+  c_file = scratch + ext
+  c_file64 = scratch + '_64' + ext
+  obj_file32 = scratch + '_32.o'
+  obj_file64 = scratch + '_64.o'
+  create_c_file(c_file, symbols, header)
+
+  # We build the symbols twice, once with wasm32 and wasm64.
+  # The first build gives is that base signature of each function.
+  # The second build build allows us to determine which args/returns are pointers
+  # or `size_t` types.  These get marked as `p` in the `__sig`.
+  cmd = ['-c',
+         '-Wno-deprecated-declarations',
+         '-I' + utils.path_from_root('system/lib/libc'),
+         '-I' + utils.path_from_root('system/lib/wasmfs')]
+  if not cxx:
+    cmd += ['-I' + utils.path_from_root('system/lib/pthread'),
+            '-I' + utils.path_from_root('system/lib/libc/musl/src/include'),
+            '-I' + utils.path_from_root('system/lib/libc/musl/src/internal'),
+            '-I' + utils.path_from_root('system/lib/gl'),
+            '-I' + utils.path_from_root('system/lib/libcxxabi/include')]
+  if extra_cflags:
+    cmd += extra_cflags
+  shared.check_call([compiler] + clang_flags32 + cmd + [c_file, '-o', obj_file32])
+  sig_info32 = extract_sigs(symbols, obj_file32)
+
+  # Only functions that take or return i32 values under wasm32 can have
+  # pointer or `size_t` types, so only those need to be built again with
+  # memory64.  All other signatures are the same under wasm64.
+  symbols64 = [s for s, t in sig_info32.items()
+               if webassembly.Type.I32 in t.params or webassembly.Type.I32 in t.returns]
+  sig_info64 = {}
+  if symbols64:
+    create_c_file(c_file64, symbols64, header)
+    shared.check_call([compiler] + clang_flags64 + cmd + [c_file64, '-o', obj_file64])
+    sig_info64 = extract_sigs(symbols64, obj_file64)
+
+  sig_info = {}
+  for sym, sig32 in sig_info32.items():
+    sig_info[sym] = functype_to_str(sig32, sig_info64.get(sym, sig32))
+  return sig_info
+
+
+def get_scratch_name(tmpdir):
+  # Scratch files are reused by each subsequent task in the same (worker)
+  # process and are cleaned up along with `tmpdir` by the caller.
+  return os.path.join(tmpdir, f'scratch_{os.getpid()}')
+
+
+def get_sig_settings(extra_settings):
   settings = {
     # Enable as many settings as we can here to ensure the maximum number
     # of JS symbols are included.
@@ -314,61 +509,81 @@ def extract_sig_info(sig_info, extra_settings=None, extra_cflags=None, cxx=False
   }
   if extra_settings:
     settings.update(extra_settings)
-  with tempfiles.get_file('.json') as settings_json:
-    utils.write_file(settings_json, json.dumps(settings))
-    output = shared.run_js_tool(utils.path_from_root('src/compiler.mjs'),
-                                ['--symbols-only', settings_json],
-                                stdout=subprocess.PIPE, cwd=utils.path_from_root())
-  symbols = json.loads(output)['deps'].keys()
-  symbols = [s for s in symbols if not ignore_symbol(s, cxx)]
-  if cxx:
-    ext = '.cpp'
-    compiler = shared.EMXX
-    header = cxx_header
+  return settings
+
+
+def extract_symbols(tmpdir, settings, cxx):
+  """Run compiler.mjs to find the native symbols that the JS library refers to
+  when built with the given settings."""
+  settings_json = get_scratch_name(tmpdir) + '.json'
+  utils.write_file(settings_json, json.dumps(settings))
+  output = shared.run_js_tool(utils.path_from_root('src/compiler.mjs'),
+                              ['--symbol-names-only', '--exclude-symbols=' + ignored_symbol_re, settings_json],
+                              stdout=subprocess.PIPE, cwd=utils.path_from_root())
+  return [s for s in output.splitlines() if not ignore_symbol(s, cxx)]
+
+
+def extract_sig_info(configs, use_cache, jobs):
+  """Return the signatures found for each of the given configurations, where
+  each configuration is an (extra_settings, extra_cflags, cxx) tuple.
+
+  This happens in two phases, each of which runs in parallel.  First we run
+  compiler.mjs for each configuration to find the symbols it uses.  Then we
+  compile the union of those symbols once per set of compiler flags, since
+  the signatures only depend on the flags and not on the settings.
+  """
+  settings = [get_sig_settings(extra_settings) for extra_settings, _, _ in configs]
+
+  # Each configuration takes several seconds to process, so cache the results
+  # on disk keyed on everything that could influence them.
+  cache_names = [f'gen_sig_info/{sig_cache_key(s, extra_cflags, cxx)}.json'
+                 for s, (_, extra_cflags, cxx) in zip(settings, configs)]
+  if use_cache:
+    results = [read_cached_sig_info(name) for name in cache_names]
   else:
-    ext = '.c'
-    compiler = shared.EMCC
-    header = c_header
-  with tempfiles.get_file(ext) as c_file:
-    create_c_file(c_file, symbols, header)
-
-    # We build the `.c` file twice, once with wasm32 and wasm64.
-    # The first build gives is that base signature of each function.
-    # The second build build allows us to determine which args/returns are pointers
-    # or `size_t` types.  These get marked as `p` in the `__sig`.
-    obj_file = 'out.o'
-    cmd = [compiler, c_file, '-c', '-pthread',
-           '--tracing',
-           '-Wno-deprecated-declarations',
-           '-I' + utils.path_from_root('system/lib/libc'),
-           '-I' + utils.path_from_root('system/lib/wasmfs'),
-           '-o', obj_file]
-    if not cxx:
-      cmd += ['-I' + utils.path_from_root('system/lib/pthread'),
-              '-I' + utils.path_from_root('system/lib/libc/musl/src/include'),
-              '-I' + utils.path_from_root('system/lib/libc/musl/src/internal'),
-              '-I' + utils.path_from_root('system/lib/gl'),
-              '-I' + utils.path_from_root('system/lib/libcxxabi/include')]
-    if extra_cflags:
-      cmd += extra_cflags
-    shared.check_call(cmd)
-    sig_info32 = extract_sigs(symbols, obj_file)
-
-    # Run the same command again with memory64.
-    shared.check_call(cmd + ['-sMEMORY64', '-Wno-experimental'])
-    sig_info64 = extract_sigs(symbols, obj_file)
-
-    for sym, sig32 in sig_info32.items():
-      assert sym in sig_info64
-      sig64 = sig_info64[sym]
-      sig_string = functype_to_str(sig32, sig64)
-      if sym in sig_info:
-        if sig_info[sym] != sig_string:
-          print(sym)
-          print(sig_string)
-          print(sig_info[sym])
-          assert sig_info[sym] == sig_string
-      sig_info[sym] = sig_string
+    results = [None] * len(configs)
+  todo = [i for i, result in enumerate(results) if result is None]
+  if not todo:
+    return results
+  for i in todo:
+    print(' .. ' + str(configs[i][0]) + ' + ' + str(configs[i][1]))
+
+  # Use ProcessPoolExecutor rather than multiprocessing.Pool since the former
+  # propagates `SystemExit` (e.g. from `exit_with_error` when a compile fails)
+  # back to us, whereas the latter would hang.
+  with tempfile.TemporaryDirectory(prefix='gen_sig_info_', dir=shared.TEMP_DIR) as tmpdir, \
+       concurrent.futures.ProcessPoolExecutor(jobs) as executor:
+    # The clang flags only depend on `cxx` (and memory64), so fetch each of
+    # them once, alongside the compiler.mjs runs.
+    clang_flags = {(cxx, memory64): executor.submit(get_clang_flags, cxx, memory64)
+                   for cxx in sorted({configs[i][2] for i in todo})
+                   for memory64 in (False, True)}
+    symbol_lists = list(executor.map(functools.partial(extract_symbols, tmpdir),
+                                     [settings[i] for i in todo],
+                                     [configs[i][2] for i in todo]))
+
+    # Collect the (ordered) union of the symbols for each set of flags.
+    groups = {}
+    for i, symbols in zip(todo, symbol_lists):
+      _, extra_cflags, cxx = configs[i]
+      groups.setdefault((cxx, tuple(extra_cflags or ())), {}).update(dict.fromkeys(symbols))
+    keys = list(groups)
+    clang_flags = {key: future.result() for key, future in clang_flags.items()}
+    group_sigs = executor.map(functools.partial(compile_sig_info, tmpdir),
+                              [list(groups[k]) for k in keys],
+                              [list(extra_cflags) for _, extra_cflags in keys],
+                              [cxx for cxx, _ in keys],
+                              [clang_flags[(cxx, False)] for cxx, _ in keys],
+                              [clang_flags[(cxx, True)] for cxx, _ in keys])
+    group_sigs = dict(zip(keys, group_sigs))
+
+  for i, symbols in zip(todo, symbol_lists):
+    _, extra_cflags, cxx = configs[i]
+    sigs = group_sigs[(cxx, tuple(extra_cflags or ()))]
+    results[i] = {s: sigs[s] for s in symbols}
+    if use_cache:
+      write_cached_sig_info(cache_names[i], results[i])
+  return results
 
 
 def main(args):
@@ -376,28 +591,45 @@ def main(args):
   parser.add_argument('-o', '--output', default='src/library_sigs.js')
   parser.add_argument('-r', '--remove', action='store_true', help='remove from JS library files any `__sig` entires that are part of the auto-generated file')
   parser.add_argument('-u', '--update', action='store_true', help='update with JS library files any `__sig` entires that are part of the auto-generated file')
+  parser.add_argument('--no-cache', dest='use_cache', action='store_false', help='ignore (and do not populate) the cache of previously extracted signatures')
+  parser.add_argument('-j', '--jobs', type=int, default=shared.get_num_cores(), help='maximum number of processes to run in parallel')
   args = parser.parse_args()
 
+  # Run the sanity checks once up front.  This also sets
+  # EMCC_SKIP_SANITY_CHECK in the environment so that none of the many
+  # compiler subprocesses we run below repeat them.
+  shared.check_sanity()
+
   print('generating signatures ...')
+  # Each entry here is an (extra_settings, extra_cflags, cxx) tuple.
+  configs = [
+    ({'WASMFS': 1,
+      'JS_LIBRARIES': [],
+      'USE_SDL': 0,
+      'MAX_WEBGL_VERSION': 0,
+      'BUILD_AS_WORKER': 1,
+      'LINK_AS_CXX': 1,
+      'AUTO_JS_LIBRARIES': 0}, None, True),
+    ({'WASM_WORKERS': 1, 'JS_LIBRARIES': ['src/library_wasm_worker.js']}, None, False),
+    ({'USE_GLFW': 3}, ['-DGLFW3'], False),
+    ({'JS_LIBRARIES': ['src/embind/embind.js', 'src/embind/emval.js'],
+      'USE_SDL': 0,
+      'MAX_WEBGL_VERSION': 0,
+      'AUTO_JS_LIBRARIES': 0,
+      'ASYNCIFY': 1}, ['-std=c++20'], True),
+    ({'LEGACY_GL_EMULATION': 1}, ['-DGLES'], False),
+    ({'USE_GLFW': 2, 'FULL_ES3': 1, 'MAX_WEBGL_VERSION': 2}, None, False),
+    ({'STANDALONE_WASM': 1}, None, False),
+    ({'MAIN_MODULE': 2, 'RELOCATABLE': 1, 'USE_WEBGPU': 1, 'ASYNCIFY': 1}, None, False),
+  ]
+
+  # A frozen cache is read-only (and might not contain our results anyway).
+  use_cache = args.use_cache and not config.FROZEN_CACHE
+  results = extract_sig_info(configs, use_cache, args.jobs)
+
   sig_info = {}
-  extract_sig_info(sig_info, {'WASMFS': 1,
-                              'JS_LIBRARIES': [],
-                              'USE_SDL': 0,
-                              'MAX_WEBGL_VERSION': 0,
-                              'BUILD_AS_WORKER': 1,
-                              'LINK_AS_CXX': 1,
-                              'AUTO_JS_LIBRARIES': 0}, cxx=True)
-  extract_sig_info(sig_info, {'WASM_WORKERS': 1, 'JS_LIBRARIES': ['src/library_wasm_worker.js']})
-  extract_sig_info(sig_info, {'USE_GLFW': 3}, ['-DGLFW3'])
-  extract_sig_info(sig_info, {'JS_LIBRARIES': ['src/embind/embind.js', 'src/embind/emval.js'],
-                              'USE_SDL': 0,
-                              'MAX_WEBGL_VERSION': 0,
-                              'AUTO_JS_LIBRARIES': 0,
-                              'ASYNCIFY': 1}, cxx=True, extra_cflags=['-std=c++20'])
-  extract_sig_info(sig_info, {'LEGACY_GL_EMULATION': 1}, ['-DGLES'])
-  extract_sig_info(sig_info, {'USE_GLFW': 2, 'FULL_ES3': 1, 'MAX_WEBGL_VERSION': 2})
-  extract_sig_info(sig_info, {'STANDALONE_WASM': 1})
-  extract_sig_info(sig_info, {'MAIN_MODULE': 2, 'RELOCATABLE': 1, 'USE_WEBGPU': 1, 'ASYNCIFY': 1})
+  for result in results:
+    merge_sig_info(sig_info, result)
 
   write_sig_library(args.output, sig_info)
   if args.update: